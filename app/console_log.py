@@ -0,0 +1,76 @@
+# app/console_log.py
+import atexit
+import io
+import logging
+import sys
+import threading
+
+# Console output of the diagnostic scripts goes through stdout's 8 KB buffer and
+# is flushed on a timer instead of once per line
+CONSOLE_FLUSH_INTERVAL = 1.0  # seconds
+
+_handler = None
+_flusher = None
+_stop_flushing = threading.Event()
+
+
+class BufferedConsoleHandler(logging.StreamHandler):
+    """StreamHandler on a block-buffered stdout that flushes immediately on WARNING and above"""
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self.flush()
+
+
+def _open_stream():
+    """Text stream over stdout's binary buffer without per-line flushing"""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only object (IDE, test runner)
+        return sys.stdout
+    # Share stdout's underlying BufferedWriter so flushes keep output in order
+    return io.TextIOWrapper(buffer, encoding=sys.stdout.encoding or "utf-8",
+                            errors="replace", line_buffering=False, write_through=False)
+
+
+def _flush_periodically():
+    while not _stop_flushing.wait(CONSOLE_FLUSH_INTERVAL):
+        _handler.flush()
+
+
+def _close():
+    _stop_flushing.set()
+    _flusher.join()
+    _handler.acquire()
+    try:
+        _handler.stream.flush()
+        if _handler.stream is not sys.stdout:
+            _handler.stream.detach()  # leave sys.stdout's buffer open for the interpreter
+            _handler.stream = sys.stdout  # late records still reach the console
+    finally:
+        _handler.release()
+
+
+def get_logger(name):
+    """Logger that writes bare messages to the shared buffered console handler"""
+    global _handler, _flusher
+    if _handler is None:
+        _handler = BufferedConsoleHandler(_open_stream())
+        _handler.setFormatter(logging.Formatter("%(message)s"))
+
+        _flusher = threading.Thread(target=_flush_periodically, daemon=True)
+        _flusher.start()
+        atexit.register(_close)
+
+    logger = logging.getLogger(name)
+    if _handler not in logger.handlers:
+        logger.addHandler(_handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def flush_console():
+    """Write out buffered log lines (call before prompting with input())"""
+    if _handler is not None:
+        _handler.flush()
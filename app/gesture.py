@@ -1,13 +1,36 @@
 # app/gesture.py
+import os
+
+# Keep OpenMP single-threaded and give the remaining cores to MediaPipe's
+# XNNPACK delegate; must be set before cv2/mediapipe are imported
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("XNNPACK_NUM_THREADS", str(max(1, (os.cpu_count() or 1) - 1)))
+
 import cv2
 import mediapipe as mp
 import numpy as np
 import logging
 import time
-import os
-from PyQt5.QtCore import QObject, pyqtSignal
+import platform
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt5.QtCore import Qt, QObject, QMutex, QSize, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage, QPainter
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy implementation is used instead
+    njit = None
 from app.config import (
     HAND_DETECTION_CONFIDENCE, 
+    HAND_TRACKING_CONFIDENCE,
+    HAND_MODEL_COMPLEXITY,
+    INFERENCE_FRAME_STRIDE,
+    LANDMARK_REUSE_MAX_SHIFT,
+    ROI_DRIFT_CHECK_INTERVAL,
+    ROI_DRIFT_THRESHOLD,
+    INFERENCE_MAX_SIZE,
     MAX_NUM_HANDS, 
     GESTURE_ACTIONS,
     FRAME_WIDTH,
@@ -15,55 +38,178 @@ from app.config import (
     VOLUME_STEP,
     GESTURE_COOLDOWN,
     CAMERA_INDEX,
+    CAMERA_AUTO_DETECT,
+    CAMERA_PREFERRED_FPS,
+    CAMERA_LOW_LATENCY_BUFFER,
+    CAMERA_DECODE_STRIDE,
+    CAMERA_RESUME_FLUSH_GRABS,
+    VIDEO_DECODE_STRIDE,
+    VIDEO_SEEK_MIN_FRAMES,
     USE_RTSP_CAMERA,
     RTSP_URL,
-    RTSP_TRANSPORT
+    RTSP_TRANSPORT,
+    RTSP_USE_PYAV,
+    OPENCV_NUM_THREADS,
+    OPENCV_USE_OPENCL
 )
 from app.media_controller import VolumeController, MediaPlayerController
+from app.pyav_capture import PyAVCapture, pyav_available
+
+# The per-frame OpenCV work is small; extra OpenCV threads only compete with TFLite
+cv2.setUseOptimized(True)
+cv2.setNumThreads(OPENCV_NUM_THREADS)
+cv2.ocl.setUseOpenCL(OPENCV_USE_OPENCL)
+
+# DirectShow opens cameras much faster than the default backend chain on Windows
+CAMERA_PROBE_BACKEND = cv2.CAP_DSHOW if platform.system() == "Windows" else cv2.CAP_ANY
+
+# QImage.Format_BGR888 (Qt 5.14+) wraps OpenCV frames without a color conversion
+_QIMAGE_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+# Landmark indices of the finger tips and the joints they are compared against
+_THUMB_TIP = 4
+_THUMB_IP = 3
+_FINGER_TIPS = np.array([8, 12, 16, 20], dtype=np.intp)
+_FINGER_PIPS = np.array([6, 10, 14, 18], dtype=np.intp)
 
-def detect_cameras():
+
+def _finger_count_kernel(pts):
+    """Count raised fingers from a (21, 2) float32 landmark array"""
+    count = 1 if pts[_THUMB_TIP, 0] < pts[_THUMB_IP, 0] else 0
+    for i in range(_FINGER_TIPS.shape[0]):
+        if pts[_FINGER_TIPS[i], 1] < pts[_FINGER_PIPS[i], 1]:
+            count += 1
+    return count
+
+
+if njit is not None:
+    _finger_count_kernel = njit(cache=True, fastmath=True)(_finger_count_kernel)
+
+
+def _probe_camera(index):
+    """Return the camera index if it opens and delivers a frame, otherwise None"""
+    cap = cv2.VideoCapture(index, CAMERA_PROBE_BACKEND)
+    ok = cap.isOpened() and cap.read()[0]
+    cap.release()
+    return index if ok else None
+
+
+def detect_cameras(first_only=False):
     """Detect available cameras and return a list of working camera indices"""
     available_cameras = []
-    for i in range(10):  # Check first 10 camera indices
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            ret, _ = cap.read()
-            if ret:
-                available_cameras.append(i)
-                logging.info(f"Camera {i} detected and working")
-            cap.release()
-        else:
-            break
-    return available_cameras
+    # Probe all indices concurrently; with first_only, stop at the first working camera
+    executor = ThreadPoolExecutor(max_workers=10)
+    futures = [executor.submit(_probe_camera, i) for i in range(10)]  # Check first 10 camera indices
+    try:
+        for future in as_completed(futures):
+            index = future.result()
+            if index is None:
+                continue
+            available_cameras.append(index)
+            logging.info(f"Camera {index} detected and working")
+            if first_only:
+                break
+    finally:
+        executor.shutdown(wait=not first_only, cancel_futures=True)
+    return sorted(available_cameras)
 
 class GestureRecognizer(QObject):
     # Signals for UI communication
     gesture_detected = pyqtSignal(str, int)  # gesture_name, finger_count
-    frame_processed = pyqtSignal(object)  # processed frame for display
     status_update = pyqtSignal(str)  # status messages
     
+    # Decode buffers in use at once: one being decoded, two in the read queue, one
+    # in inference, two in the output queue and one in the emitter (the display
+    # gets its own QImage copy); one spare slot on top of that. Slots go back to
+    # the free list only once the emitter is done with them, so a buffer is never
+    # decoded into while it is still being annotated or converted
+    FRAME_RING_SIZE = 8
+    
     def __init__(self, video_source=None):
         super().__init__()
         self.video_source = video_source  # Can be None (camera), or path to video file
         self.is_video_file = bool(video_source)  # True if using a video file, False if using camera
         self.mp_hands = mp.solutions.hands
+        # Tracking mode derives each ROI from the previous landmarks and only
+        # re-runs palm detection when tracking confidence drops
         self.hands = self.mp_hands.Hands(
+            static_image_mode=False,
             max_num_hands=MAX_NUM_HANDS, 
-            min_detection_confidence=HAND_DETECTION_CONFIDENCE
+            model_complexity=HAND_MODEL_COMPLEXITY,
+            min_detection_confidence=HAND_DETECTION_CONFIDENCE,
+            min_tracking_confidence=HAND_TRACKING_CONFIDENCE
         )
         self.mp_draw = mp.solutions.drawing_utils  # Corrected import
         
-        # Initialize video source (camera or video file)
-        self.cap = self._initialize_video_source()
+        # MediaPipe runs on one long-lived thread so the TFLite interpreter stays warm
+        self._infer_in = queue.Queue(maxsize=2)
+        self._infer_out = queue.Queue(maxsize=2)
+        self._infer_thread = threading.Thread(target=self._inference_loop, daemon=True)
+        self._infer_thread.start()
         
-        # Set frame size from config (only for USB cameras, not for video files)
-        if self.cap and not USE_RTSP_CAMERA and not self.is_video_file:
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
+        # Decode every Nth frame (None = per-source default from config); frames in
+        # between are only grabbed. Both settings apply from the next run();
+        # set before the capture opens, which reads low_latency_buffer
+        self.decode_stride = None
+        self._stride = 1
+        self.low_latency_buffer = CAMERA_LOW_LATENCY_BUFFER
+        
+        # Initialize video source (camera or video file)
+        self._open_capture()
         
         self.prev_gesture = None
-        self.last_action_time = 0
+        self.last_action_time = float("-inf")
+        self.cooldown = GESTURE_COOLDOWN
+        # Gesture action per finger count (0-5), None where nothing is mapped
+        self._actions = [GESTURE_ACTIONS.get(i) for i in range(6)]
+        
+        # Pre-rendered gesture label overlays, keyed by label text
+        self._label_sprites = {}
+        for label in ["No hands detected"] + [
+                f"{i} fingers - {action or 'Unknown'}" for i, action in enumerate(self._actions)]:
+            self._label_sprites[label] = self._render_label(label)
         self._running = True
+        # Cleared by pause(): the worker threads park while the capture and
+        # MediaPipe graph stay loaded
+        self._resumed = threading.Event()
+        self._resumed.set()
+        
+        # Bounded queues connecting the reader, inference and emitter threads
+        self._read_q = queue.Queue(maxsize=2)
+        self._out_q = queue.Queue(maxsize=2)
+        # Single-slot queue holding only the newest camera frame
+        self._latest_q = queue.Queue(maxsize=1)
+        
+        # Single-slot mailbox for the display image, polled by the UI thread
+        self._display_lock = QMutex()
+        self._latest_display = None
+        # Target (width, height) for display images, replaced whole by the UI thread
+        self._display_size = (0, 0)
+        # RGB conversion buffer (Qt < 5.14 only) and scaled output image reused by the emitter thread
+        self._display_rgb = None
+        self._scaled_image = None
+        self._scaled_key = None  # (frame size, display size) the scaled image was built for
+        self._snapshot_path = None  # set by request_snapshot, consumed by the emitter thread
+        
+        # Smoothed per-frame processing time, used to pace the loop
+        self._ema_frame_time = 0.0
+        self._target_fps = CAMERA_PREFERRED_FPS
+        
+        # Landmark cache used to skip inference while the hand is stable
+        self._reset_landmark_cache()
+        
+        # Ring of decode buffers reused by the reader thread instead of allocating per
+        # frame; indices of the buffers not in flight wait in _free_slots
+        self._ring = [None] * self.FRAME_RING_SIZE
+        self._free_slots = queue.Queue()
+        
+        # Reusable buffers for MediaPipe input (re-allocated on shape change)
+        self._small = None
+        self._rgb = None
+        
+        # Compile (or load from cache) the Numba kernel before the first real frame
+        if njit is not None:
+            _finger_count_kernel(np.zeros((21, 2), dtype=np.float32))
         
         # Initialize volume controller
         try:
@@ -81,6 +227,25 @@ class GestureRecognizer(QObject):
             logging.warning(f"Media player controller initialization failed: {e}")
             self.has_media_control = False
 
+    def _open_capture(self):
+        """Open the current video source and apply the configured camera frame size"""
+        self.cap = self._initialize_video_source()
+        
+        # Set frame size from config (only for USB cameras, not for video files)
+        if self.cap and not USE_RTSP_CAMERA and not self.is_video_file:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_WIDTH)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_HEIGHT)
+            if self.low_latency_buffer:
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def set_video_source(self, video_source):
+        """Switch between camera (None) and a video file; the source is opened on the next run()"""
+        if video_source == self.video_source and self.cap is not None:
+            return
+        self.release_resources()
+        self.video_source = video_source
+        self.is_video_file = bool(video_source)
+
     def _initialize_video_source(self):
         """Initialize video source (camera or video file)"""
         
@@ -91,6 +256,17 @@ class GestureRecognizer(QObject):
         # Otherwise, initialize camera
         return self._initialize_camera()
     
+    def _open_video_file(self):
+        """Open the video file with PyAV (hardware decode) if available, else OpenCV"""
+        if pyav_available():
+            try:
+                cap = PyAVCapture(self.video_source)
+                logging.info("Decoding video file with PyAV")
+                return cap
+            except Exception as e:
+                logging.warning(f"PyAV could not open video file, falling back to OpenCV: {e}")
+        return cv2.VideoCapture(self.video_source)
+
     def _initialize_video_file(self):
         """Initialize video file input"""
         logging.info(f"Initializing video file: {self.video_source}")
@@ -100,7 +276,7 @@ class GestureRecognizer(QObject):
                 logging.error(f"Video file not found: {self.video_source}")
                 return None
             
-            cap = cv2.VideoCapture(self.video_source)
+            cap = self._open_video_file()
             
             if not cap.isOpened():
                 logging.error("Failed to open video file")
@@ -142,16 +318,27 @@ class GestureRecognizer(QObject):
         else:
             return self._initialize_usb_camera()
     
-    def _initialize_rtsp_camera(self):
-        """Initialize RTSP camera connection"""
-        logging.info(f"Initializing RTSP camera: {RTSP_URL}")
+    def _open_rtsp_stream(self):
+        """Open the RTSP stream with PyAV (low-delay demuxing) if available, else OpenCV's FFmpeg backend"""
+        if RTSP_USE_PYAV and pyav_available():
+            try:
+                cap = PyAVCapture(RTSP_URL, options={"rtsp_transport": RTSP_TRANSPORT}, live=True)
+                logging.info("Decoding RTSP stream with PyAV")
+                return cap
+            except Exception as e:
+                logging.warning(f"PyAV could not open RTSP stream, falling back to OpenCV: {e}")
         
         # Set OpenCV FFMPEG options for RTSP
         os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = f"rtsp_transport;{RTSP_TRANSPORT}"
+        # Create VideoCapture with RTSP URL and FFMPEG backend
+        return cv2.VideoCapture(RTSP_URL, cv2.CAP_FFMPEG)
+
+    def _initialize_rtsp_camera(self):
+        """Initialize RTSP camera connection"""
+        logging.info(f"Initializing RTSP camera: {RTSP_URL}")
         
         try:
-            # Create VideoCapture with RTSP URL and FFMPEG backend
-            cap = cv2.VideoCapture(RTSP_URL, cv2.CAP_FFMPEG)
+            cap = self._open_rtsp_stream()
             
             # Set buffer size to reduce latency
             cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
@@ -193,7 +380,7 @@ class GestureRecognizer(QObject):
         
         # If configured camera fails, detect available cameras
         logging.warning(f"USB camera {CAMERA_INDEX} not available, detecting other cameras...")
-        available_cameras = detect_cameras()
+        available_cameras = detect_cameras(first_only=CAMERA_AUTO_DETECT)
         
         if available_cameras:
             # Try to use the first available camera
@@ -206,34 +393,130 @@ class GestureRecognizer(QObject):
         logging.error("No working cameras found!")
         return None
 
+    @staticmethod
+    def landmarks_to_array(hand_landmarks):
+        """Extract the 21 hand landmarks into a single (21, 2) array of normalized x, y"""
+        return np.fromiter(
+            (c for lm in hand_landmarks.landmark for c in (lm.x, lm.y)),
+            dtype=np.float32, count=42
+        ).reshape(21, 2)
+
+    @staticmethod
+    def count_from_points(pts):
+        """Count raised fingers from a (21, 2) landmark array without per-finger branching"""
+        if njit is not None:
+            return _finger_count_kernel(pts)
+        
+        # Thumb extends sideways (x), the other four fingers extend upwards (y)
+        thumb = int(pts[_THUMB_TIP, 0] < pts[_THUMB_IP, 0])
+        fingers = np.count_nonzero(pts[_FINGER_TIPS, 1] < pts[_FINGER_PIPS, 1])
+        return thumb + int(fingers)
+
     def count_raised_fingers(self, hand_landmarks):
-        tips_ids = [4, 8, 12, 16, 20]
-        fingers = []
+        return self.count_from_points(self.landmarks_to_array(hand_landmarks))
+
+    def _reset_landmark_cache(self):
+        """Forget the cached hand landmarks so the next frame runs full inference"""
+        self._cached_result = None
+        self._cached_count = None
+        self._cached_centroid = None
+        self._hand_stable = False
+        self._roi_box = None
+        self._roi_ref = None
+        self._frames_since_infer = 0
+        # Counts reused frames, not frame indices: with a small stride the reuse
+        # frames all share one index parity and could never hit the interval
+        self._reuses_since_drift_check = 0
+
+    def _roi_drifted(self, frame):
+        """Cheap check, every ROI_DRIFT_CHECK_INTERVAL reused frames, that the cached hand region still matches"""
+        if self._roi_box is None:
+            return False
+        self._reuses_since_drift_check += 1
+        if self._reuses_since_drift_check < ROI_DRIFT_CHECK_INTERVAL:
+            return False
+        self._reuses_since_drift_check = 0
+        x0, y0, x1, y1 = self._roi_box
+        gray = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        return float(cv2.absdiff(gray, self._roi_ref).mean()) > ROI_DRIFT_THRESHOLD
 
-        # Thumb
-        if hand_landmarks.landmark[tips_ids[0]].x < hand_landmarks.landmark[tips_ids[0] - 1].x:
-            fingers.append(1)
+    def _update_landmark_cache(self, frame, result):
+        """Store a fresh inference result and decide whether it can be reused"""
+        if not result.multi_hand_landmarks:
+            self._reset_landmark_cache()
+            return
+        
+        hand_landmarks = result.multi_hand_landmarks[0]
+        height, width = frame.shape[:2]
+        pts = self.landmarks_to_array(hand_landmarks)
+        xs = pts[:, 0] * width
+        ys = pts[:, 1] * height
+        centroid = (xs.mean(), ys.mean())
+        finger_count = self.count_from_points(pts)
+        
+        # Stable when the gesture is unchanged and the hand barely moved
+        self._hand_stable = (
+            self._cached_centroid is not None
+            and finger_count == self._cached_count
+            and np.hypot(centroid[0] - self._cached_centroid[0],
+                         centroid[1] - self._cached_centroid[1]) < LANDMARK_REUSE_MAX_SHIFT
+        )
+        self._cached_result = result
+        self._cached_count = finger_count
+        self._cached_centroid = centroid
+        
+        # Keep a grayscale copy of the hand region for drift checks
+        x0, x1 = max(int(xs.min()), 0), min(int(xs.max()) + 1, width)
+        y0, y1 = max(int(ys.min()), 0), min(int(ys.max()) + 1, height)
+        if x1 > x0 and y1 > y0:
+            self._roi_box = (x0, y0, x1, y1)
+            self._roi_ref = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
         else:
-            fingers.append(0)
+            self._roi_box = None
+            self._roi_ref = None
 
-        # Fingers (index to pinky)
-        for id in range(1, 5):
-            if hand_landmarks.landmark[tips_ids[id]].y < hand_landmarks.landmark[tips_ids[id] - 2].y:
-                fingers.append(1)
-            else:
-                fingers.append(0)
+    def _resize_for_inference(self, frame):
+        """Downscale a frame so its longest side is at most INFERENCE_MAX_SIZE"""
+        height, width = frame.shape[:2]
+        scale = INFERENCE_MAX_SIZE / max(height, width)
+        if scale >= 1:
+            return frame
+        
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if self._small is None or self._small.shape[:2] != (size[1], size[0]):
+            self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        return cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
 
-        return fingers.count(1)
+    def _inference_loop(self):
+        """Serve hands.process requests until a None sentinel arrives"""
+        while True:
+            rgb_frame = self._infer_in.get()
+            if rgb_frame is None:
+                break
+            self._infer_out.put(self.hands.process(rgb_frame))
+
+    def _process_hands(self, frame, rgb_frame):
+        """Run MediaPipe Hands, reusing the previous landmarks while the hand is stable"""
+        self._frames_since_infer += 1
+        if (self._hand_stable
+                and self._frames_since_infer < INFERENCE_FRAME_STRIDE
+                and not self._roi_drifted(frame)):
+            return self._cached_result
+        
+        self._infer_in.put(rgb_frame)
+        result = self._infer_out.get()
+        self._frames_since_infer = 0
+        self._update_landmark_cache(frame, result)
+        return result
 
     def map_gesture_to_action(self, finger_count):
-        now = time.time()
-        cooldown = GESTURE_COOLDOWN  # Use value from config
+        now = time.monotonic()
 
-        if now - self.last_action_time < cooldown:
+        if now - self.last_action_time < self.cooldown:
             return
 
         # Get action from config if available, otherwise use None
-        gesture_action = GESTURE_ACTIONS.get(finger_count)
+        gesture_action = self._actions[finger_count]
         
         # Execute the corresponding media control action
         if gesture_action:
@@ -244,10 +527,10 @@ class GestureRecognizer(QObject):
             # Perform the actual media control action
             if gesture_action == "volume_up" and self.has_volume_control:
                 self.volume_controller.volume_up(VOLUME_STEP)
-                logging.info(f"Volume increased to {self.volume_controller.volume.GetMasterVolumeLevelScalar() * 100:.0f}%")
+                logging.info(f"Volume increased to {self.volume_controller.level * 100:.0f}%")
             elif gesture_action == "volume_down" and self.has_volume_control:
                 self.volume_controller.volume_down(VOLUME_STEP)
-                logging.info(f"Volume decreased to {self.volume_controller.volume.GetMasterVolumeLevelScalar() * 100:.0f}%")
+                logging.info(f"Volume decreased to {self.volume_controller.level * 100:.0f}%")
             elif gesture_action == "play" and self.has_media_control:
                 logging.info("Play action triggered")
                 self.media_controller.play()
@@ -264,19 +547,302 @@ class GestureRecognizer(QObject):
             # Emit signal for UI update
             self.gesture_detected.emit(gesture_action, finger_count)
 
+    # Gesture label style and position (baseline-left origin, as for cv2.putText)
+    LABEL_ORIGIN = (10, 30)
+    LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+    LABEL_SCALE = 0.7
+    LABEL_COLOR = (0, 255, 0)
+    LABEL_THICKNESS = 2
+
+    def _render_label(self, text):
+        """Rasterize a label once into a sprite and mask for cheap per-frame blitting"""
+        (width, height), baseline = cv2.getTextSize(
+            text, self.LABEL_FONT, self.LABEL_SCALE, self.LABEL_THICKNESS)
+        pad = self.LABEL_THICKNESS
+        sprite = np.zeros((height + baseline + 2 * pad, width + 2 * pad, 3), dtype=np.uint8)
+        cv2.putText(sprite, text, (pad, pad + height), self.LABEL_FONT,
+                    self.LABEL_SCALE, self.LABEL_COLOR, self.LABEL_THICKNESS)
+        mask = sprite.any(axis=2, keepdims=True)
+        return sprite, mask, pad + height, pad
+
+    def _draw_label(self, frame, text):
+        """Blit the pre-rendered label onto the frame, falling back to putText"""
+        if text not in self._label_sprites:
+            self._label_sprites[text] = self._render_label(text)
+        sprite, mask, ascent, pad = self._label_sprites[text]
+        
+        x0 = self.LABEL_ORIGIN[0] - pad
+        y0 = self.LABEL_ORIGIN[1] - ascent
+        y1, x1 = y0 + sprite.shape[0], x0 + sprite.shape[1]
+        if x0 < 0 or y0 < 0 or y1 > frame.shape[0] or x1 > frame.shape[1]:
+            cv2.putText(frame, text, self.LABEL_ORIGIN, self.LABEL_FONT,
+                        self.LABEL_SCALE, self.LABEL_COLOR, self.LABEL_THICKNESS)
+            return
+        np.copyto(frame[y0:y1, x0:x1], sprite, where=mask)
+
     def restart_video(self):
         """Restart the video file from the beginning"""
         if self.is_video_file and self.cap:
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._reset_landmark_cache()
             logging.info("Video restarted from beginning")
             self.status_update.emit("Video restarted")
     
+    @pyqtSlot()
     def stop(self):
         """Stop the gesture recognition loop"""
         self._running = False
+        self._resumed.set()  # wake parked threads so they see the stop
         logging.info("Stopping gesture recognition...")
 
+    def pause(self):
+        """Park the running loop without releasing the capture"""
+        self._resumed.clear()
+        logging.info("Gesture recognition paused")
+
+    def resume(self):
+        """Continue a paused loop, picking up the current decode stride"""
+        self._configure_pacing()
+        self._reset_landmark_cache()
+        self._ema_frame_time = 0.0
+        self._resumed.set()
+        logging.info("Gesture recognition resumed")
+
+    @property
+    def paused(self):
+        return not self._resumed.is_set()
+
+    def _configure_pacing(self):
+        """Resolve the decode stride and the frame rate the loop is paced to"""
+        default_stride = VIDEO_DECODE_STRIDE if self.is_video_file else CAMERA_DECODE_STRIDE
+        self._stride = max(1, int(self.decode_stride or default_stride))
+        
+        # Video files are paced to their own frame rate (divided by the decode
+        # stride, since only every Nth frame comes through), cameras to the preferred rate
+        self._target_fps = CAMERA_PREFERRED_FPS
+        if self.is_video_file:
+            fps = self.cap.get(cv2.CAP_PROP_FPS) or CAMERA_PREFERRED_FPS
+            self._target_fps = fps / self._stride
+
+    def _reset_free_slots(self):
+        """Mark every ring buffer free (at the start of a run, with no threads running)"""
+        self._free_slots = queue.Queue()
+        for slot in range(self.FRAME_RING_SIZE):
+            self._free_slots.put(slot)
+
+    def _acquire_slot(self, block=True):
+        """Take a free ring slot, or None if there is none (non-blocking) or the loop stopped"""
+        while self._running:
+            try:
+                return self._free_slots.get(block, timeout=0.5)
+            except queue.Empty:
+                if not block:
+                    return None
+        return None
+
+    def _release_slot(self, slot):
+        """Return a ring slot once nothing downstream uses its frame any more"""
+        self._free_slots.put(slot)
+
+    def _read_into_ring(self, read, slot):
+        """Call cap.read/cap.retrieve with ring buffer ``slot`` as destination"""
+        success, frame = read(self._ring[slot])
+        if success:
+            # OpenCV re-allocates when the shape changes, so keep whatever came back
+            self._ring[slot] = frame
+        else:
+            self._release_slot(slot)
+        return success, frame
+
+    def _frames_behind(self):
+        """Number of strided steps to skip to keep a video file in real time"""
+        return int(self._ema_frame_time * self._target_fps) - 1
+
+    def _reader_loop(self):
+        """Read video file frames sequentially and feed them to the inference loop"""
+        while self._running:
+            if not self._resumed.wait(timeout=0.5):
+                continue
+            # Jump ahead when processing can't keep up with the file's frame rate
+            behind = self._frames_behind()
+            if behind > 0:
+                # _target_fps is per strided step, so convert back to source frames
+                skip = behind * self._stride
+                if skip < VIDEO_SEEK_MIN_FRAMES:
+                    # A seek lands on the previous keyframe and decodes forward,
+                    # so for short jumps grabbing ahead is cheaper
+                    for _ in range(skip):
+                        if not self.cap.grab():
+                            break
+                else:
+                    position = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
+                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, position + skip)
+                    # The smoothed frame time still includes the lag the seek just
+                    # made up; start it afresh so the next read doesn't seek again
+                    self._ema_frame_time = 0.0
+            
+            # Frames between strides are grabbed (decoded) but never converted to BGR
+            for _ in range(self._stride - 1):
+                if not self.cap.grab():
+                    break
+            # Waits while every buffer is still downstream, throttling the reader
+            slot = self._acquire_slot()
+            if slot is None:
+                break
+            success, frame = self._read_into_ring(self.cap.read, slot)
+            if not success:
+                logging.info("Reached end of video file")
+                self.status_update.emit("Video processing completed")
+                # Loop the video if desired
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+            
+            # Blocks while the inference loop is busy, throttling the reader
+            frame_index = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+            self._read_q.put((frame_index, frame, slot))
+        
+        # Sentinel tells the inference loop there are no more frames
+        self._read_q.put(None)
+
+    def _put_latest(self, item):
+        """Replace whatever frame is waiting in the latest-frame slot"""
+        try:
+            stale = self._latest_q.get_nowait()
+        except queue.Empty:
+            stale = None
+        if stale is not None:
+            self._release_slot(stale[2])
+        self._latest_q.put(item)
+
+    def _grabber_loop(self):
+        """Grab camera frames continuously, keeping only the newest one"""
+        frame_index = 0
+        while self._running:
+            if not self._resumed.is_set():
+                # Nothing drained the device while paused; drop its backlog on resume
+                if self._resumed.wait(timeout=0.5) and self._running:
+                    for _ in range(CAMERA_RESUME_FLUSH_GRABS):
+                        self.cap.grab()
+                continue
+            for _ in range(self._stride - 1):
+                self.cap.grab()
+            if not self.cap.grab():
+                logging.error("Failed to read from camera")
+                break
+            # Every buffer still downstream: keep draining the device, skip the decode
+            slot = self._acquire_slot(block=False)
+            if slot is None:
+                continue
+            success, frame = self._read_into_ring(self.cap.retrieve, slot)
+            if not success:
+                continue
+            
+            # Mirror camera feeds in place (video files are never flipped)
+            cv2.flip(frame, 1, dst=frame)
+            
+            # Stale frames are dropped so inference always sees the latest image
+            frame_index += 1
+            self._put_latest((frame_index, frame, slot))
+        
+        # Sentinel tells the inference loop there are no more frames
+        self._put_latest(None)
+
+    def set_display_size(self, width, height):
+        """Set the size display images are scaled to (called from the UI thread)"""
+        self._display_size = (width, height)
+
+    def _wrap_frame(self, frame):
+        """Wrap an annotated BGR frame as a QImage without copying where Qt allows"""
+        height, width = frame.shape[:2]
+        if _QIMAGE_BGR888 is not None:
+            # Qt reads OpenCV's BGR layout directly; the frame outlives the image
+            return QImage(frame.data, width, height, frame.strides[0], _QIMAGE_BGR888)
+        if self._display_rgb is None or self._display_rgb.shape != frame.shape:
+            self._display_rgb = np.empty(frame.shape, dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._display_rgb)
+        return QImage(self._display_rgb.data, width, height, 3 * width, QImage.Format_RGB888)
+
+    def _to_display_image(self, frame):
+        """Convert an annotated BGR frame into a QImage scaled for the display"""
+        height, width = frame.shape[:2]
+        image = self._wrap_frame(frame)
+        
+        # QImage (unlike QPixmap) may be used off the GUI thread
+        target_w, target_h = self._display_size
+        if target_w <= 0 or target_h <= 0 or (target_w, target_h) == (width, height):
+            return image.copy()  # detach from the reused conversion buffer
+        
+        # Only allocate a new scaled image when the frame or display size changes
+        key = (width, height, target_w, target_h)
+        if key != self._scaled_key:
+            size = QSize(width, height).scaled(target_w, target_h, Qt.KeepAspectRatio)
+            self._scaled_image = QImage(size, QImage.Format_RGB32)
+            self._scaled_key = key
+        
+        # No SmoothPixmapTransform hint, so this is a nearest-neighbour scale (quality is
+        # reserved for _snapshot). If the UI
+        # still holds the previous frame's copy, QPainter detaches instead of overwriting it
+        painter = QPainter(self._scaled_image)
+        painter.drawImage(self._scaled_image.rect(), image)
+        painter.end()
+        return QImage(self._scaled_image)  # shallow, implicitly shared copy
+
+    def request_snapshot(self, path):
+        """Save the next display frame to ``path`` (called from the UI thread)"""
+        self._snapshot_path = path
+
+    def _snapshot(self, frame, path):
+        """Save a frame at display size with smooth (bilinear) scaling"""
+        image = self._wrap_frame(frame)
+        target_w, target_h = self._display_size
+        if target_w > 0 and target_h > 0:
+            image = image.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if image.save(path):
+            logging.info(f"Snapshot saved to {path}")
+            self.status_update.emit(f"Snapshot saved: {os.path.basename(path)}")
+        else:
+            logging.error(f"Could not save snapshot to {path}")
+
+    def _publish_frame(self, image):
+        """Store the newest display image, replacing one the UI hasn't taken yet"""
+        self._display_lock.lock()
+        try:
+            self._latest_display = image
+        finally:
+            self._display_lock.unlock()
+
+    def take_latest_frame(self):
+        """Return the newest display QImage, or None if nothing new arrived"""
+        self._display_lock.lock()
+        try:
+            frame = self._latest_display
+            self._latest_display = None
+        finally:
+            self._display_lock.unlock()
+        return frame
+
+    def _emitter_loop(self):
+        """Convert annotated frames to display images and hand them over to the UI"""
+        while True:
+            item = self._out_q.get()
+            if item is None:
+                break
+            frame, slot = item
+            try:
+                if self._snapshot_path is not None:
+                    path, self._snapshot_path = self._snapshot_path, None
+                    self._snapshot(frame, path)
+                self._publish_frame(self._to_display_image(frame))
+            except Exception as e:
+                logging.error(f"Error preparing display frame: {e}")
+            finally:
+                # The display image is a detached copy, so the buffer can be reused
+                self._release_slot(slot)
+
     def run(self):
+        # The capture is released at the end of every run, so reopen it here
+        if self.cap is None or not self.cap.isOpened():
+            self._open_capture()
         if not self.cap:
             error_msg = "No video source available for gesture recognition!"
             logging.error(error_msg)
@@ -287,35 +853,55 @@ class GestureRecognizer(QObject):
         logging.info(f"Starting {source_type} for gesture recognition.")
         self.status_update.emit(f"Processing {source_type}...")
         self._running = True
+        self._resumed.set()
         
         # For video files, get total frame count for progress tracking
         total_frames = 0
         if self.is_video_file:
             total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
         
-        frame_count = 0
+        self._configure_pacing()
+        self._ema_frame_time = 0.0
+        self._reset_landmark_cache()
+        self._reset_free_slots()
         
-        while self._running:
-            success, frame = self.cap.read()
-            if not success:
-                if self.is_video_file:
-                    logging.info("Reached end of video file")
-                    self.status_update.emit("Video processing completed")
-                    # Loop the video if desired
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                    continue
-                else:
-                    logging.error("Failed to read from camera")
-                    break
+        # Video files must be read sequentially; cameras only need the newest frame
+        if self.is_video_file:
+            frames_q = self._read_q
+            reader_target = self._reader_loop
+        else:
+            frames_q = self._latest_q
+            reader_target = self._grabber_loop
+        
+        # Decode and emit run on their own threads so they overlap with inference
+        reader = threading.Thread(target=reader_target, daemon=True)
+        emitter = threading.Thread(target=self._emitter_loop, daemon=True)
+        reader.start()
+        emitter.start()
+        
+        while True:
+            try:
+                item = frames_q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            frame_count, frame, slot = item
+            if not self._resumed.is_set():
+                self._release_slot(slot)
+                continue  # frame was already in flight when pause() was called
 
-            frame_count += 1
-            
-            # Don't flip video files, only camera feeds
-            if not self.is_video_file:
-                frame = cv2.flip(frame, 1)
+            start = time.monotonic()
                 
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            result = self.hands.process(rgb_frame)
+            # Landmarks are normalized, so inference can run on a downscaled copy
+            small = self._resize_for_inference(frame)
+            # MediaPipe needs a C-contiguous RGB array: a reversed [..., ::-1] view
+            # would only be copied again (into a fresh allocation) by the binding,
+            # so swap channels once into the reusable buffer instead
+            if self._rgb is None or self._rgb.shape != small.shape:
+                self._rgb = np.empty_like(small)
+            rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            result = self._process_hands(frame, rgb_frame)
 
             # Draw hand landmarks and detect gestures
             current_gesture = "No hands detected"
@@ -330,12 +916,11 @@ class GestureRecognizer(QObject):
                     self.map_gesture_to_action(finger_count)
                     
                     # Get gesture name for display
-                    gesture_name = GESTURE_ACTIONS.get(finger_count, "Unknown")
+                    gesture_name = self._actions[finger_count] or "Unknown"
                     current_gesture = f"{finger_count} fingers - {gesture_name}"
 
             # Add text overlay with current gesture info
-            cv2.putText(frame, current_gesture, (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            self._draw_label(frame, current_gesture)
             
             # Add frame counter for video files
             if self.is_video_file and total_frames > 0:
@@ -343,11 +928,20 @@ class GestureRecognizer(QObject):
                 cv2.putText(frame, progress_text, (10, frame.shape[0] - 20), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
 
-            # Emit processed frame for UI display
-            self.frame_processed.emit(frame.copy())
+            # Sleep off whatever is left of the frame interval
+            dt = time.monotonic() - start
+            self._ema_frame_time = 0.9 * self._ema_frame_time + 0.1 * dt
+            target_interval = 1.0 / self._target_fps
+            if dt < target_interval:
+                time.sleep(target_interval - dt)
+
+            # Blocks while the UI hand-off is behind
+            self._out_q.put((frame, slot))
 
-            # Small delay to prevent excessive CPU usage
-            cv2.waitKey(1)
+        # Unwind the emitter and wait for both helper threads
+        self._out_q.put(None)
+        emitter.join()
+        reader.join()
 
         # Clean up resources
         self.release_resources()
@@ -356,6 +950,14 @@ class GestureRecognizer(QObject):
         """Release camera and close windows"""
         if self.cap and self.cap.isOpened():
             self.cap.release()
+        self.cap = None
         cv2.destroyAllWindows()
         self.status_update.emit("Resources released")
         logging.info("Camera feed closed.")
+
+    def close(self):
+        """Release the video source and shut down the inference thread for good"""
+        self.release_resources()
+        if self._infer_thread.is_alive():
+            self._infer_in.put(None)
+            self._infer_thread.join()
@@ -1,31 +1,55 @@
 # app/media_controller.py
+import functools
 import platform
 import logging
 import pyautogui
 import time
 
-if platform.system() == "Windows":
+from app.config import VOLUME_RESYNC_INTERVAL
+
+
+@functools.lru_cache(maxsize=1)
+def _endpoint():
+    """Activate the default speaker's volume endpoint once per process"""
+    # pycaw/COM are only imported when a controller is actually created
+    if platform.system() != "Windows":
+        raise NotImplementedError("Advanced media control currently supports only Windows.")
     from ctypes import cast, POINTER
     from comtypes import CLSCTX_ALL
     from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-else:
-    raise NotImplementedError("Advanced media control currently supports only Windows.")
+    
+    devices = AudioUtilities.GetSpeakers()
+    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    return cast(interface, POINTER(IAudioEndpointVolume))
+
 
 class VolumeController:
     def __init__(self):
-        self.devices = AudioUtilities.GetSpeakers()
-        self.interface = self.devices.Activate(
-            IAudioEndpointVolume._iid_, CLSCTX_ALL, None
-        )
-        self.volume = cast(self.interface, POINTER(IAudioEndpointVolume))
+        self.volume = _endpoint()
+        # Shadow copy of the master level, so volume steps don't need a COM read each time
+        self._sync()
+
+    def _sync(self):
+        """Re-read the master level from the endpoint"""
+        self._level = self.volume.GetMasterVolumeLevelScalar()
+        self._synced_at = time.monotonic()
+
+    @property
+    def level(self):
+        """Current volume level (0.0 to 1.0), re-read from COM only when stale"""
+        if time.monotonic() - self._synced_at >= VOLUME_RESYNC_INTERVAL:
+            self._sync()
+        return self._level
 
     def mute(self):
         logging.info("Muting system volume.")
         self.volume.SetMute(1, None)
+        self._sync()
 
     def unmute(self):
         logging.info("Unmuting system volume.")
         self.volume.SetMute(0, None)
+        self._sync()
 
     def set_volume(self, level: float):
         """
@@ -34,15 +58,14 @@ class VolumeController:
         level = max(0.0, min(1.0, level))  # clamp
         logging.info(f"Setting volume to {level * 100:.0f}%")
         self.volume.SetMasterVolumeLevelScalar(level, None)
+        self._level = level
 
     def volume_up(self, step=0.05):
-        current = self.volume.GetMasterVolumeLevelScalar()
-        new_volume = min(current + step, 1.0)
+        new_volume = min(self.level + step, 1.0)
         self.set_volume(new_volume)
 
     def volume_down(self, step=0.05):
-        current = self.volume.GetMasterVolumeLevelScalar()
-        new_volume = max(current - step, 0.0)
+        new_volume = max(self.level - step, 0.0)
         self.set_volume(new_volume)
 
 class MediaPlayerController:
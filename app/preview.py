@@ -0,0 +1,27 @@
+# app/preview.py
+import time
+
+import cv2
+
+# Live previews only need frames at display rate
+PREVIEW_FPS = 30
+
+
+def grab_latest(cap, budget=1.0 / PREVIEW_FPS):
+    """Grab queued frames for up to ``budget`` seconds, then decode only the newest"""
+    deadline = time.perf_counter() + budget
+    if not cap.grab():
+        return False, None
+    # grab() advances the stream without the YUV->BGR conversion; only the
+    # frame that is actually shown goes through retrieve()
+    while time.perf_counter() < deadline and cap.grab():
+        pass
+    return cap.retrieve()
+
+
+def preview_until(deadline, windows):
+    """Show every {window name: frame} until ``deadline`` (perf_counter), pumping events"""
+    for name, frame in windows.items():
+        cv2.imshow(name, frame)
+    while time.perf_counter() < deadline:
+        cv2.waitKey(1)
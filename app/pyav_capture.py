@@ -0,0 +1,160 @@
+# app/pyav_capture.py
+import logging
+import threading
+import cv2
+
+try:
+    import av
+    # Raised for demux/decode failures, like a dropped or timed-out live stream
+    AVError = getattr(av, "FFmpegError", None) or av.AVError  # renamed in PyAV 9
+except ImportError:  # PyAV is optional; video files fall back to cv2.VideoCapture
+    av = None
+
+try:
+    from av.codec.hwaccel import HWAccel, hwdevices_available
+except ImportError:  # PyAV < 14 has no hardware decode support
+    HWAccel = None
+
+# Hardware decoders to try, in order of preference
+PREFERRED_HW_DEVICES = ("cuda", "videotoolbox", "d3d11va", "dxva2", "vaapi", "qsv")
+
+# Demuxer/decoder options for live streams: hand packets over as they arrive
+LIVE_STREAM_OPTIONS = {"fflags": "nobuffer", "flags": "low_delay"}
+LIVE_STREAM_TIMEOUT = 5.0  # seconds, for opening and for each read
+
+
+def pyav_available():
+    """True when PyAV can be used for video file and RTSP decoding"""
+    return av is not None
+
+
+def _select_hwaccel():
+    """Return an HWAccel for the first available hardware decoder, or None"""
+    if HWAccel is None:
+        return None
+    available = set(hwdevices_available())
+    for device in PREFERRED_HW_DEVICES:
+        if device in available:
+            logging.info(f"Using {device} hardware video decoding")
+            return HWAccel(device_type=device, allow_software_fallback=True)
+    return None
+
+
+class PyAVCapture:
+    """Video file or live stream reader backed by PyAV, exposing the cv2.VideoCapture calls the recognizer uses"""
+
+    def __init__(self, path, options=None, live=False):
+        if av is None:
+            raise ImportError("PyAV is not installed")
+        kwargs = {}
+        hwaccel = _select_hwaccel()
+        if hwaccel is not None:
+            kwargs["hwaccel"] = hwaccel
+        if live:
+            kwargs["options"] = {**LIVE_STREAM_OPTIONS, **(options or {})}
+            kwargs["timeout"] = LIVE_STREAM_TIMEOUT
+        elif options:
+            kwargs["options"] = options
+        self.container = av.open(path, **kwargs)
+        self.stream = self.container.streams.video[0]
+        # Frame threading buffers one frame per thread, which a live feed can't
+        # afford; slice threading decodes each frame in parallel without delay
+        self.stream.thread_type = "SLICE" if live else "AUTO"
+        self.fps = float(self.stream.average_rate or 0)
+        self._lock = threading.Lock()  # restart_video() seeks from the UI thread
+        self._opened = True
+        self._position = 0
+        self._pending = None  # frame decoded past a seek target, returned by the next read()
+        self._grabbed = None  # frame from the last grab(), converted by retrieve()
+        self._frames = self._decode()
+
+    def _decode(self):
+        for packet in self.container.demux(self.stream):
+            for frame in packet.decode():
+                yield frame
+
+    def _frame_index(self, frame):
+        if frame.pts is None or not self.fps:
+            return self._position + 1
+        return int(round(float(frame.pts * self.stream.time_base) * self.fps)) + 1
+
+    def _seek(self, index):
+        """Seek to the keyframe before ``index`` and decode forward to it"""
+        index = max(0, int(index))
+        target = int(index / self.fps / self.stream.time_base) if self.fps else 0
+        self.container.seek(target, stream=self.stream)
+        self._frames = self._decode()
+        self._position = 0
+        self._pending = None
+        if index == 0:
+            return
+        for frame in self._frames:
+            if self._frame_index(frame) > index:
+                self._pending = frame
+                break
+            self._position = self._frame_index(frame)
+
+    def isOpened(self):
+        return self._opened
+
+    def _next_frame(self):
+        frame, self._pending = self._pending, None
+        if frame is None:
+            try:
+                frame = next(self._frames, None)
+            except AVError as e:
+                # Report a broken stream the way VideoCapture does: as a failed read
+                logging.error(f"PyAV decode failed: {e}")
+                frame = None
+        if frame is not None:
+            self._position = self._frame_index(frame)
+        return frame
+
+    def grab(self):
+        """Advance one frame without converting it to an array"""
+        with self._lock:
+            self._grabbed = self._next_frame()
+            return self._grabbed is not None
+
+    def retrieve(self, image=None):
+        """Convert the frame from the last grab() (camera streams grab, then retrieve)"""
+        with self._lock:
+            frame, self._grabbed = self._grabbed, None
+            if frame is None:
+                return False, None
+            return True, frame.to_ndarray(format="bgr24")
+
+    def read(self, image=None):
+        # ``image`` is accepted for VideoCapture compatibility; PyAV always
+        # hands back a new array from to_ndarray
+        with self._lock:
+            frame = self._next_frame()
+            if frame is None:
+                return False, None
+            return True, frame.to_ndarray(format="bgr24")
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self._position
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return self.stream.frames
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.stream.codec_context.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.stream.codec_context.height
+        return 0
+
+    def set(self, prop, value):
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        with self._lock:
+            self._seek(value)
+        return True
+
+    def release(self):
+        with self._lock:
+            if self._opened:
+                self.container.close()
+                self._opened = False
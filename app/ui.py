@@ -3,62 +3,216 @@
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QMessageBox,
     QHBoxLayout, QFrame, QSizePolicy, QFileDialog, QGroupBox,
-    QRadioButton, QButtonGroup, QTextEdit, QScrollArea
+    QRadioButton, QButtonGroup, QTextEdit, QSpinBox, QCheckBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize
-from PyQt5.QtGui import QFont, QColor, QPalette, QLinearGradient, QBrush, QIcon, QPixmap, QImage, QKeySequence
+from PyQt5.QtCore import (
+    Qt, QMetaObject, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
+)
+from PyQt5.QtGui import QPixmap, QKeySequence, QTextCursor
 import logging
-import cv2
-import numpy as np
 import os
+import time
+from collections import deque
 
 from app.gesture import GestureRecognizer
-from app.config import SUPPORTED_VIDEO_FORMATS
+from app.config import (
+    SUPPORTED_VIDEO_FORMATS, DISPLAY_MAX_FPS, CAMERA_LOW_LATENCY_BUFFER, GESTURE_LOG_LIMIT
+)
+
+
+# Gesture log line: [HH:MM:SS] <gesture>
+_LOG_ENTRY_FMT = "[{}] {}"
+
+# Stylesheets are module constants so every widget reuses the same strings
+_PRIMARY_QSS = """
+    QPushButton {
+        background-color: #2979FF;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 15px;
+    }
+    QPushButton:hover {
+        background-color: #1565C0;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton:disabled {
+        background-color: #BDBDBD;
+        color: #757575;
+    }
+"""
+
+_DANGER_QSS = """
+    QPushButton {
+        background-color: #F44336;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 15px;
+    }
+    QPushButton:hover {
+        background-color: #D32F2F;
+    }
+    QPushButton:pressed {
+        background-color: #B71C1C;
+    }
+"""
 
+_WINDOW_QSS = """
+    QWidget {
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+        color: white;
+    }
+    QWidget#root {
+        background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                    stop: 0 #1A237E, stop: 1 #303F9F);
+    }
+    QLabel {
+        color: white;
+    }
+    QLabel#titleLabel {
+        color: white;
+        font-size: 24px;
+        font-weight: bold;
+    }
+    QLabel#statusLabel {
+        color: #E0E0E0;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 10px;
+        background-color: rgba(0, 0, 0, 0.2);
+        border-radius: 10px;
+    }
+    QFrame#contentFrame {
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 15px;
+        padding: 20px;
+    }
+    QGroupBox {
+        color: white;
+        font-weight: bold;
+        font-size: 14px;
+        border: 2px solid rgba(255, 255, 255, 0.3);
+        border-radius: 10px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+"""
 
-class GestureWorker(QThread):
+_MSGBOX_QSS = """
+    QMessageBox {
+        background-color: #303F9F;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #2979FF;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1565C0;
+    }
+"""
+
+
+class WorkerSignals(QObject):
+    """Signals for the thread-pool tasks below (QRunnable is not a QObject)"""
     finished = pyqtSignal()
-    gesture_detected = pyqtSignal(str, int)
-    frame_processed = pyqtSignal(object)
-    status_update = pyqtSignal(str)
+    # constructed GestureRecognizer; kept as object so the queued event holds a
+    # Python reference until the GUI thread takes ownership
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)  # error message
+
 
-    def __init__(self, video_source=None):
+class RecognizerLoader(QRunnable):
+    """Builds the GestureRecognizer (MediaPipe graph + camera) off the GUI thread"""
+    def __init__(self, target_thread):
         super().__init__()
-        self.recognizer = GestureRecognizer(video_source)
-        
-        # Connect signals
-        self.recognizer.gesture_detected.connect(self.gesture_detected.emit)
-        self.recognizer.frame_processed.connect(self.frame_processed.emit)
-        self.recognizer.status_update.connect(self.status_update.emit)
+        self.target_thread = target_thread
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            recognizer = GestureRecognizer()
+            # Hand the QObject to the GUI thread; pool threads have no event loop
+            recognizer.moveToThread(self.target_thread)
+        except Exception as e:
+            logging.error(f"Gesture recognizer initialization failed: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(recognizer)
+
+
+class GestureRunnable(QRunnable):
+    """Reusable thread-pool task that runs a long-lived GestureRecognizer"""
+    def __init__(self, recognizer):
+        super().__init__()
+        self.recognizer = recognizer
+        self.signals = WorkerSignals()
+        # Resolve the stop hook once; it queues the slot on the recognizer's own (GUI) thread
+        if hasattr(recognizer, 'stop'):
+            self._stop_fn = lambda: QMetaObject.invokeMethod(recognizer, "stop", Qt.QueuedConnection)
+        else:
+            self._stop_fn = lambda: None
+        # Keep ownership on the Python side so the same runnable can be started again
+        self.setAutoDelete(False)
 
     def run(self):
         logging.info("Gesture thread started")
         self.recognizer.run()  # Will run until stopped or 'q' is pressed
-        self.finished.emit()
+        self.signals.finished.emit()
 
     def stop(self):
-        # Stop the gesture recognizer
-        if hasattr(self.recognizer, 'stop'):
-            self.recognizer.stop()
-        logging.info("Gesture thread stop requested")
+        try:
+            self._stop_fn()
+        except RuntimeError as e:  # recognizer's C++ object already deleted
+            logging.warning(f"Gesture thread stop failed: {e}")
+            return
+        logging.debug("Gesture thread stop requested")
 
 
 class StatusIndicator(QFrame):
     """A colored indicator to show the current status"""
+    _QSS = {
+        "active": "border-radius: 7px; background-color: #4CAF50;",
+        "stopping": "border-radius: 7px; background-color: #FFC107;",
+        "idle": "border-radius: 7px; background-color: #888888;",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(15, 15)
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Raised)
-        self.setStyleSheet("border-radius: 7px; background-color: #888888;")
+        self._current = "idle"
+        self.setStyleSheet(self._QSS["idle"])
     
     def set_status(self, status):
-        if status == "active":
-            self.setStyleSheet("border-radius: 7px; background-color: #4CAF50;")
-        elif status == "stopping":
-            self.setStyleSheet("border-radius: 7px; background-color: #FFC107;")
-        else:  # idle
-            self.setStyleSheet("border-radius: 7px; background-color: #888888;")
+        if status not in self._QSS:
+            status = "idle"
+        # Re-asserting the same status would only re-parse the stylesheet
+        if status == self._current:
+            return
+        self._current = status
+        self.setStyleSheet(self._QSS[status])
 
 
 class StyledButton(QPushButton):
@@ -74,100 +228,95 @@ class StyledButton(QPushButton):
         self.update_style()
         
     def update_style(self):
-        if self.primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #2979FF;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 15px;
-                }
-                QPushButton:hover {
-                    background-color: #1565C0;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-                QPushButton:disabled {
-                    background-color: #BDBDBD;
-                    color: #757575;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #F44336;
-                    color: white;
-                    border: none;
-                    padding: 10px 20px;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 15px;
-                }
-                QPushButton:hover {
-                    background-color: #D32F2F;
-                }
-                QPushButton:pressed {
-                    background-color: #B71C1C;
-                }
-            """)
+        self.setStyleSheet(_PRIMARY_QSS if self.primary else _DANGER_QSS)
 
 
 class MediaControllerUI(QWidget):
     def __init__(self):
         super().__init__()
+        
         self.setWindowTitle("Gesture-Based Media Controller")
         self.setGeometry(300, 200, 900, 700)
         
-        # Set up gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor("#1A237E"))
-        gradient.setColorAt(1, QColor("#303F9F"))
-        
-        palette = self.palette()
-        palette.setBrush(QPalette.Window, QBrush(gradient))
-        self.setPalette(palette)
-        
-        # Base styling
-        self.setStyleSheet("""
-            QWidget {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-                color: white;
-            }
-            QLabel {
-                color: white;
-            }
-            QLabel#titleLabel {
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-            }
-            QLabel#statusLabel {
-                color: #E0E0E0;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: rgba(0, 0, 0, 0.2);
-                border-radius: 10px;
-            }
-            QFrame#contentFrame {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 20px;
-            }
-        """)
+        # Base styling; the gradient background is part of the stylesheet and
+        # stretches with the window, so resizing needs no palette updates
+        self.setObjectName("root")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(_WINDOW_QSS)
 
         self.gesture_active = False
-        self.worker_thread = None
         self.video_source = None  # None for camera, path for video file
         self.current_gesture = "No gesture detected"
-        self.gesture_log = []
+        self.gesture_log = deque(maxlen=GESTURE_LOG_LIMIT)  # recent entries, for export
 
         self.init_ui()
         self.setup_shortcuts()
+        
+        # Exit confirmation, built and styled once and reused on every quit attempt
+        self._confirm_box = QMessageBox(self)
+        self._confirm_box.setWindowTitle("Confirm Exit")
+        self._confirm_box.setText("Gesture recognition is active. Stop it and exit?")
+        self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        self._confirm_box.setStyleSheet(_MSGBOX_QSS)
+        
+        # One recognizer (MediaPipe graph + capture) for the whole session, built
+        # in the background at startup and run on the global thread pool each
+        # time recognition starts
+        self.thread_pool = QThreadPool.globalInstance()
+        self.recognizer = None
+        self.runnable = None
+        self.recognizer_ready = False
+        self._close_requested = False
+        # True while the pool task is alive, including while it is paused between
+        # runs; a restart is queued when the parked worker has the wrong source
+        self._worker_alive = False
+        self._restart_pending = False
+        self.toggle_button.setEnabled(False)
+        
+        # Fires if the gesture thread hasn't finished within 3 seconds of a stop request
+        self._stop_timer = QTimer(self)
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.setInterval(3000)
+        self._stop_timer.timeout.connect(self._on_stop_timeout)
+        
+        # Polls the recognizer's latest-frame slot at display rate while recognition
+        # runs; frames the UI doesn't get to are dropped instead of queuing up
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(int(1000 / DISPLAY_MAX_FPS))
+        self._frame_timer.timeout.connect(self._drain_frame)
+        
+        # Gesture and status signals only record the latest value; this timer
+        # applies them at most 10 times a second
+        self._pending_gesture = None
+        self._pending_status = None
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(100)
+        self._label_timer.timeout.connect(self._apply_pending_updates)
+        self.status_label.setText("Status: Loading gesture model...")
+        
+        self._loader = RecognizerLoader(self.thread())
+        self._loader.signals.loaded.connect(self.on_recognizer_loaded)
+        self._loader.signals.failed.connect(self.on_recognizer_failed)
+        self.thread_pool.start(self._loader)
+
+    def on_recognizer_loaded(self, recognizer):
+        """Wire up the pre-warmed recognizer and allow recognition to start"""
+        self.recognizer = recognizer
+        self.recognizer.gesture_detected.connect(self._queue_gesture)
+        self.recognizer.status_update.connect(self._queue_status)
+        self.runnable = GestureRunnable(self.recognizer)
+        self.runnable.signals.finished.connect(self.on_thread_finished)
+        
+        self.recognizer_ready = True
+        self._sync_display_size()
+        self.toggle_button.setEnabled(True)
+        self.status_label.setText("Status: Idle")
+        logging.info("Gesture recognizer ready")
+
+    def on_recognizer_failed(self, message):
+        self.status_label.setText(f"Status: Initialization failed - {message}")
 
     def init_ui(self):
         main_layout = QHBoxLayout()
@@ -185,6 +334,10 @@ class MediaControllerUI(QWidget):
         main_layout.addWidget(right_panel, 2)
         
         self.setLayout(main_layout)
+        
+        # Single status animation, reused by every toggle
+        self._status_anim = QPropertyAnimation(self.status_label, b"minimumHeight", self)
+        self._status_anim.setDuration(300)
     
     def create_control_panel(self):
         """Create the left control panel"""
@@ -200,22 +353,6 @@ class MediaControllerUI(QWidget):
         
         # Video source selection
         source_group = QGroupBox("Video Source")
-        source_group.setStyleSheet("""
-            QGroupBox {
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         source_layout = QVBoxLayout(source_group)
         
         # Radio buttons for source selection
@@ -241,9 +378,27 @@ class MediaControllerUI(QWidget):
         file_layout.addWidget(self.video_path_label, 1)
         file_layout.addWidget(self.browse_button)
         
+        # Decode stride (0 = per-source default) and camera buffer latency
+        stride_layout = QHBoxLayout()
+        stride_label = QLabel("Decode every")
+        stride_label.setStyleSheet("color: white;")
+        self.stride_spin = QSpinBox()
+        self.stride_spin.setRange(0, 5)
+        self.stride_spin.setSpecialValueText("Auto")
+        self.stride_spin.setSuffix(" frame(s)")
+        self.stride_spin.setToolTip("Frames in between are grabbed but not decoded")
+        stride_layout.addWidget(stride_label)
+        stride_layout.addWidget(self.stride_spin, 1)
+        
+        self.low_latency_check = QCheckBox("Low-latency camera buffer")
+        self.low_latency_check.setStyleSheet("QCheckBox { color: white; }")
+        self.low_latency_check.setChecked(CAMERA_LOW_LATENCY_BUFFER)
+        
         source_layout.addWidget(self.camera_radio)
         source_layout.addWidget(self.video_radio)
         source_layout.addLayout(file_layout)
+        source_layout.addLayout(stride_layout)
+        source_layout.addWidget(self.low_latency_check)
         
         # Connect radio button signals
         self.camera_radio.toggled.connect(self.on_source_changed)
@@ -260,22 +415,6 @@ class MediaControllerUI(QWidget):
         
         # Current gesture display
         gesture_group = QGroupBox("Current Gesture")
-        gesture_group.setStyleSheet("""
-            QGroupBox {
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         gesture_layout = QVBoxLayout(gesture_group)
         
         self.current_gesture_label = QLabel(self.current_gesture)
@@ -323,26 +462,10 @@ class MediaControllerUI(QWidget):
         
         # Video display area
         video_group = QGroupBox("Video Feed")
-        video_group.setStyleSheet("""
-            QGroupBox {
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         video_layout = QVBoxLayout(video_group)
         
         # Video display label
-        self.video_label = QLabel("Video feed will appear here\n\nKeyboard Shortcuts:\n• Space: Start/Stop Recognition\n• R: Restart Video (when using video files)\n• Q: Quit Application")
+        self.video_label = QLabel("Video feed will appear here\n\nKeyboard Shortcuts:\n• Space: Start/Stop Recognition\n• R: Restart Video (when using video files)\n• S: Save Snapshot\n• Q: Quit Application")
         self.video_label.setStyleSheet("""
             background-color: rgba(0, 0, 0, 0.5);
             border: 2px dashed rgba(255, 255, 255, 0.3);
@@ -359,22 +482,6 @@ class MediaControllerUI(QWidget):
         
         # Gesture log area
         log_group = QGroupBox("Gesture Log")
-        log_group.setStyleSheet("""
-            QGroupBox {
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                border: 2px solid rgba(255, 255, 255, 0.3);
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
         log_layout = QVBoxLayout(log_group)
         
         self.gesture_log_text = QTextEdit()
@@ -390,6 +497,7 @@ class MediaControllerUI(QWidget):
         """)
         self.gesture_log_text.setMaximumHeight(150)
         self.gesture_log_text.setReadOnly(True)
+        self._log_sb = self.gesture_log_text.verticalScrollBar()
         
         log_layout.addWidget(self.gesture_log_text)
         
@@ -411,6 +519,10 @@ class MediaControllerUI(QWidget):
         self.restart_shortcut = QShortcut(QKeySequence(Qt.Key_R), self)
         self.restart_shortcut.activated.connect(self.restart_video)
         
+        # S key to save a snapshot of the video feed
+        self.snapshot_shortcut = QShortcut(QKeySequence(Qt.Key_S), self)
+        self.snapshot_shortcut.activated.connect(self._snapshot)
+        
         # Q key to quit
         self.quit_shortcut = QShortcut(QKeySequence(Qt.Key_Q), self)
         self.quit_shortcut.activated.connect(self.close_application)
@@ -454,44 +566,61 @@ class MediaControllerUI(QWidget):
             self.video_path_label.setText(os.path.basename(file_path))
             logging.info(f"Video file selected: {file_path}")
     
+    def _queue_gesture(self, gesture_name, finger_count):
+        self._pending_gesture = (gesture_name, finger_count)
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    def _queue_status(self, message):
+        self._pending_status = message
+        if not self._label_timer.isActive():
+            self._label_timer.start()
+
+    def _apply_pending_updates(self):
+        """Apply the newest gesture and status received since the last tick"""
+        gesture, self._pending_gesture = self._pending_gesture, None
+        status, self._pending_status = self._pending_status, None
+        if gesture is not None:
+            self.update_gesture_display(*gesture)
+        if status is not None:
+            self.update_status_message(status)
+
     def update_gesture_display(self, gesture_name, finger_count):
         """Update the current gesture display"""
         self.current_gesture = f"{finger_count} fingers - {gesture_name}"
         self.current_gesture_label.setText(self.current_gesture)
         
         # Add to gesture log
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {self.current_gesture}"
+        log_entry = _LOG_ENTRY_FMT.format(time.strftime("%H:%M:%S"), self.current_gesture)
         self.gesture_log.append(log_entry)
         
-        # Keep only last 50 entries
-        if len(self.gesture_log) > 50:
-            self.gesture_log.pop(0)
-        
-        # Update log display
-        self.gesture_log_text.setPlainText("\n".join(self.gesture_log))
-        self.gesture_log_text.moveCursor(self.gesture_log_text.textCursor().End)
+        # Only follow new entries if the user hasn't scrolled up
+        at_bottom = self._log_sb.value() == self._log_sb.maximum()
+        
+        # Append the new line and drop the oldest one past GESTURE_LOG_LIMIT,
+        # instead of re-rendering the whole log
+        self.gesture_log_text.append(log_entry)
+        document = self.gesture_log_text.document()
+        if document.blockCount() > GESTURE_LOG_LIMIT:
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.Start)
+            cursor.select(QTextCursor.BlockUnderCursor)
+            cursor.removeSelectedText()
+            cursor.deleteChar()  # the now-empty first block
+        if at_bottom:
+            self._log_sb.setValue(self._log_sb.maximum())
+    
+    def _drain_frame(self):
+        """Pull the newest display image from the recognizer and show it"""
+        image = self.recognizer.take_latest_frame()
+        if image is not None:
+            self.update_video_frame(image)
     
-    def update_video_frame(self, frame):
-        """Update the video display with processed frame"""
+    def update_video_frame(self, image):
+        """Update the video display with a processed frame"""
         try:
-            # Convert frame to Qt format
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            height, width, channel = rgb_frame.shape
-            bytes_per_line = 3 * width
-            
-            q_image = QImage(rgb_frame.data, width, height, bytes_per_line, QImage.Format_RGB888)
-            q_pixmap = QPixmap.fromImage(q_image)
-            
-            # Scale to fit label while maintaining aspect ratio
-            scaled_pixmap = q_pixmap.scaled(
-                self.video_label.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
-            
-            self.video_label.setPixmap(scaled_pixmap)
+            # The recognizer has already converted and scaled the frame off the GUI thread
+            self.video_label.setPixmap(QPixmap.fromImage(image))
         except Exception as e:
             logging.error(f"Error updating video frame: {e}")
     
@@ -499,13 +628,23 @@ class MediaControllerUI(QWidget):
         """Update status message from gesture recognizer"""
         self.status_label.setText(f"Status: {message}")
     
+    def _snapshot(self):
+        """Save the next processed frame, smoothly scaled, to a timestamped PNG"""
+        if not self.gesture_active:
+            return
+        path = os.path.abspath(time.strftime("snapshot_%Y%m%d_%H%M%S.png"))
+        self.recognizer.request_snapshot(path)
+
     def restart_video(self):
         """Restart the current video file"""
-        if self.worker_thread and hasattr(self.worker_thread.recognizer, 'restart_video'):
-            self.worker_thread.recognizer.restart_video()
-            logging.info("Video restart requested from UI")
+        if not self.recognizer_ready:
+            return
+        self.recognizer.restart_video()
+        logging.info("Video restart requested from UI")
 
     def toggle_gesture_mode(self):
+        if not self.recognizer_ready:
+            return
         if not self.gesture_active:
             # Validate video source selection
             if self.video_radio.isChecked() and not self.video_source:
@@ -516,8 +655,18 @@ class MediaControllerUI(QWidget):
             # Determine video source
             source = self.video_source if self.video_radio.isChecked() else None
             source_type = "video file" if source else "camera"
+            low_latency = self.low_latency_check.isChecked()
+            
+            # A parked worker can only be resumed with the capture it already has open;
+            # otherwise shut it down and start again from on_thread_finished
+            if self._worker_alive and (source != self.recognizer.video_source
+                                       or low_latency != self.recognizer.low_latency_buffer):
+                self._restart_pending = True
+                self._request_stop()
+                return
             
-            # Start gesture recognition
+            # Start gesture recognition (widget changes are batched into one repaint)
+            self.setUpdatesEnabled(False)
             self.status_label.setText(f"Status: Recognizing gestures from {source_type}...")
             self.status_indicator.set_status("active")
             self.toggle_button.setText("⏸ Stop Gesture Recognition")
@@ -528,46 +677,71 @@ class MediaControllerUI(QWidget):
 
             # Create animation for status change
             self.animate_status_change(True)
+            self.setUpdatesEnabled(True)
+            self.update()
 
             logging.info(f"Gesture Recognition Started with {source_type}")
 
-            self.worker_thread = GestureWorker(source)
-            self.worker_thread.finished.connect(self.on_thread_finished)
-            self.worker_thread.gesture_detected.connect(self.update_gesture_display)
-            self.worker_thread.frame_processed.connect(self.update_video_frame)
-            self.worker_thread.status_update.connect(self.update_status_message)
-            self.worker_thread.start()
+            self.recognizer.decode_stride = self.stride_spin.value() or None
+            if self._worker_alive:
+                self.recognizer.resume()
+            else:
+                self.recognizer.low_latency_buffer = low_latency
+                self.recognizer.set_video_source(source)
+                self._worker_alive = True
+                self.thread_pool.start(self.runnable)
+            self._frame_timer.start()
         else:
-            # Stop gesture recognition
-            self.status_label.setText("Status: Stopping...")
-            self.status_indicator.set_status("stopping")
-            self.toggle_button.setEnabled(False)
-            
-            # Create animation for status change
+            # Park the worker; MediaPipe and the capture stay loaded for the next start
+            self._frame_timer.stop()
+            self.recognizer.pause()
             self.animate_status_change(False)
-            
-            if self.worker_thread:
-                # First stop the recognizer
-                self.worker_thread.stop()
-                # Then wait for the thread to finish (with timeout)
-                if not self.worker_thread.wait(3000):  # 3 second timeout
-                    logging.warning("Thread did not exit cleanly, forcing termination")
-                    self.worker_thread.terminate()
-                    self.worker_thread.wait()
-            
-            self.status_label.setText("Status: Idle")
-            self.toggle_button.setText("▶ Start Gesture Recognition")
-            self.toggle_button.setEnabled(True)
-            self.status_indicator.set_status("idle")
-            self.restart_button.setVisible(False)  # Hide restart button when stopped
-            self.gesture_active = False
-            logging.info("Gesture Recognition Stopped")
+            self._show_idle()
+            logging.info("Gesture Recognition paused")
+
+    def _show_idle(self):
+        """Reset the controls to the idle state (batched into one repaint)"""
+        self._pending_status = None  # a late worker message must not overwrite "Idle"
+        self.setUpdatesEnabled(False)
+        self.status_label.setText("Status: Idle")
+        self.toggle_button.setText("▶ Start Gesture Recognition")
+        self.toggle_button.setEnabled(True)
+        self.status_indicator.set_status("idle")
+        self.restart_button.setVisible(False)  # Hide restart button when finished
+        self.setUpdatesEnabled(True)
+        self.update()
+        self.gesture_active = False
+
+    def _request_stop(self):
+        """Show the transitional state and ask the worker to exit without blocking"""
+        # Widget changes are batched into one repaint; on_thread_finished
+        # resets the UI once the pool task has exited
+        self.setUpdatesEnabled(False)
+        self.status_label.setText("Status: Stopping...")
+        self.status_indicator.set_status("stopping")
+        self.toggle_button.setEnabled(False)
+        self.animate_status_change(False)
+        self.setUpdatesEnabled(True)
+        self.update()
+        
+        self.runnable.stop()
+        self._stop_timer.start()
+
+    def _on_stop_timeout(self):
+        """The gesture thread is still running 3 seconds after a stop request"""
+        if not self._worker_alive:
+            return
+        logging.warning("Gesture thread did not exit within 3 seconds")
+        # Qt's teardown waits for the pool task, so the window stays up (an exit
+        # completes in on_thread_finished); keep reporting until the thread is gone
+        self.status_label.setText("Status: Still stopping...")
+        self._stop_timer.start()
 
     def animate_status_change(self, starting=True):
         """Create a subtle animation when status changes"""
-        # Create animation for status label
-        animation = QPropertyAnimation(self.status_label, b"minimumHeight")
-        animation.setDuration(300)
+        # Reconfigure the shared status label animation
+        animation = self._status_anim
+        animation.stop()
         animation.setStartValue(self.status_label.height())
         
         if starting:
@@ -580,71 +754,53 @@ class MediaControllerUI(QWidget):
         animation.start()
 
     def on_thread_finished(self):
-        self.status_label.setText("Status: Idle")
-        self.toggle_button.setText("▶ Start Gesture Recognition")
-        self.status_indicator.set_status("idle")
-        self.restart_button.setVisible(False)  # Hide restart button when finished
-        self.gesture_active = False
+        self._stop_timer.stop()
+        self._frame_timer.stop()
+        self._worker_alive = False
+        self._show_idle()
         logging.info("Gesture thread finished.")
+        
+        # Finish an exit that was waiting for the thread to stop
+        if self._close_requested:
+            self.close()
+        elif self._restart_pending:
+            # The old worker exited; start again with the newly selected source
+            self._restart_pending = False
+            self.toggle_gesture_mode()
 
     def close_application(self):
         if self.gesture_active:
-            # Create a styled message box
-            message_box = QMessageBox(self)
-            message_box.setWindowTitle("Confirm Exit")
-            message_box.setText("Gesture recognition is active. Stop it and exit?")
-            message_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            message_box.setDefaultButton(QMessageBox.No)
-            
-            # Style the message box
-            message_box.setStyleSheet("""
-                QMessageBox {
-                    background-color: #303F9F;
-                    color: white;
-                }
-                QLabel {
-                    color: white;
-                    font-size: 14px;
-                }
-                QPushButton {
-                    background-color: #2979FF;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #1565C0;
-                }
-            """)
-            
-            reply = message_box.exec_()
+            reply = self._confirm_box.exec_()
             
             if reply == QMessageBox.Yes:
-                # Stop gesture recognition
-                if self.worker_thread:
-                    self.worker_thread.stop()
-                    if not self.worker_thread.wait(3000):  # 3 second timeout
-                        logging.warning("Thread did not exit cleanly, forcing termination")
-                        self.worker_thread.terminate()
-                        self.worker_thread.wait()
-                
-                logging.info("Application exit requested.")
-                self.close()
+                # Stop gesture recognition; on_thread_finished completes the exit
+                self._close_requested = True
+                self._request_stop()
         else:
-            logging.info("Application exit requested.")
+            # closeEvent stops a paused worker first if there is one
             self.close()
+
+    def closeEvent(self, event):
+        """Close only once the pool task has exited, so Qt's teardown doesn't wait on it forever"""
+        if self._worker_alive:
+            # Running or paused worker: stop it, on_thread_finished closes again
+            event.ignore()
+            if not self._close_requested:
+                self._close_requested = True
+                self._request_stop()
+            return
+        logging.info("Application exit requested.")
+        if self.recognizer_ready:
+            self.recognizer.close()
+        super().closeEvent(event)
             
     def resizeEvent(self, event):
-        """Handle window resize events to update the gradient"""
+        """Keep the recognizer's display size in step with the video label"""
         super().resizeEvent(event)
-        
-        # Update gradient on resize
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor("#1A237E"))
-        gradient.setColorAt(1, QColor("#303F9F"))
-        
-        palette = self.palette()
-        palette.setBrush(QPalette.Window, QBrush(gradient))
-        self.setPalette(palette)
+        self._sync_display_size()
+
+    def _sync_display_size(self):
+        """Tell the recognizer what size to scale display frames to"""
+        if self.recognizer_ready:
+            size = self.video_label.size()
+            self.recognizer.set_display_size(size.width(), size.height())
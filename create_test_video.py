@@ -7,6 +7,23 @@ This script creates a simple video with text overlays showing different finger c
 import cv2
 import numpy as np
 import os
+import queue
+import threading
+
+from app.config import GESTURE_ACTIONS
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; _frame_meta then runs as plain Python
+    njit = None
+
+def _frame_meta(frame_num, frames_per_gesture, fps, n_gestures):
+    """Per-frame gesture index and timestamp in seconds"""
+    gesture_index = min(frame_num // frames_per_gesture, n_gestures - 1)
+    return gesture_index, frame_num / fps
+
+if njit is not None:
+    _frame_meta = njit(cache=True)(_frame_meta)
 
 def create_test_video():
     """Create a test video with gesture simulation"""
@@ -21,6 +38,8 @@ def create_test_video():
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
     output_path = 'test_gesture_video.mp4'
     out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    if not out.isOpened():
+        raise RuntimeError(f"Could not open video writer for {output_path} (codec or path not supported)")
     
     # Define gesture sequence (finger counts)
     gesture_sequence = [0, 1, 2, 3, 4, 5] * 5  # Repeat sequence
@@ -31,34 +50,59 @@ def create_test_video():
     print(f"Resolution: {width}x{height}")
     print(f"FPS: {fps}")
     
+    # Gradient background, built once with a single broadcast per channel
+    y = np.arange(height, dtype=np.int32)
+    color_value = (50 + (y / height) * 100).astype(np.uint8)
+    background = np.empty((height, width, 3), dtype=np.uint8)
+    background[..., 0] = color_value[:, None]
+    background[..., 1] = (color_value // 2)[:, None]
+    background[..., 2] = (color_value // 3)[:, None]
+    
+    # Encode on a background thread so rendering frame N+1 overlaps encoding frame N
+    queue_size = 4
+    write_q = queue.Queue(maxsize=queue_size)
+    write_errors = []  # set by the writer thread; it keeps draining the queue after a failure
+    writer = threading.Thread(target=_writer_loop, args=(out, write_q, write_errors), daemon=True)
+    writer.start()
+    
+    # Preallocated frames, reused round-robin: at most queue_size frames are
+    # queued plus one being encoded, so a buffer is free again by its next turn
+    frames = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(queue_size + 2)]
+    
+    # Only six hand drawings exist, so render them once and blit them per frame
+    (x0, y0, x1, y1), hand_sprites = build_hand_sprites(width, height)
+    
+    # Finger count text style
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    font_scale = 2
+    color = (255, 255, 255)
+    thickness = 3
+    
+    # Only six finger counts occur, so measure and center each label once
+    text_layout = {}
+    action_texts = {}
+    for count in range(6):
+        text = f"Fingers: {count}"
+        text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+        text_layout[count] = (text, (width - text_size[0]) // 2, (height + text_size[1]) // 2)
+        action_texts[count] = f"Action: {GESTURE_ACTIONS.get(count, 'Unknown')}"
+    
     for frame_num in range(total_frames):
-        # Create a frame
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        if write_errors:
+            break  # no point rendering frames that can't be written
         
-        # Add gradient background
-        for y in range(height):
-            color_value = int(50 + (y / height) * 100)
-            frame[y, :] = [color_value, color_value//2, color_value//3]
+        # Start each frame from the background
+        frame = frames[frame_num % len(frames)]
+        np.copyto(frame, background)
         
-        # Determine current gesture
-        gesture_index = frame_num // frames_per_gesture
-        if gesture_index >= len(gesture_sequence):
-            gesture_index = len(gesture_sequence) - 1
+        # Determine current gesture and timestamp
+        gesture_index, t_seconds = _frame_meta(
+            frame_num, frames_per_gesture, fps, len(gesture_sequence))
         
         finger_count = gesture_sequence[gesture_index]
         
         # Add text overlay
-        text = f"Fingers: {finger_count}"
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 2
-        color = (255, 255, 255)
-        thickness = 3
-        
-        # Get text size for centering
-        text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
-        text_x = (width - text_size[0]) // 2
-        text_y = (height + text_size[1]) // 2
-        
+        text, text_x, text_y = text_layout[finger_count]
         cv2.putText(frame, text, (text_x, text_y), font, font_scale, color, thickness)
         
         # Add frame counter
@@ -66,31 +110,66 @@ def create_test_video():
         cv2.putText(frame, frame_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
         
         # Add time indicator
-        time_text = f"Time: {frame_num/fps:.1f}s"
+        time_text = f"Time: {t_seconds:.1f}s"
         cv2.putText(frame, time_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
         
         # Add gesture action
-        from app.config import GESTURE_ACTIONS
-        action = GESTURE_ACTIONS.get(finger_count, "Unknown")
-        action_text = f"Action: {action}"
+        action_text = action_texts[finger_count]
         cv2.putText(frame, action_text, (10, height - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (100, 255, 100), 2)
         
         # Draw a simple hand representation
-        draw_hand_representation(frame, finger_count, width, height)
+        sprite, mask = hand_sprites[finger_count]
+        np.copyto(frame[y0:y1, x0:x1], sprite, where=mask)
         
         # Write frame
-        out.write(frame)
+        write_q.put(frame)
         
         # Show progress
         if frame_num % (fps * 2) == 0:  # Every 2 seconds
             progress = (frame_num / total_frames) * 100
             print(f"Progress: {progress:.1f}%")
     
-    # Release video writer
+    # Drain the writer thread, then release video writer
+    write_q.put(None)
+    writer.join()
     out.release()
+    if write_errors:
+        raise write_errors[0]
     print(f"Test video created successfully: {output_path}")
     return output_path
 
+def _writer_loop(out, write_q, errors):
+    """Encode queued frames until a None sentinel arrives, recording the first failure in ``errors``"""
+    while True:
+        frame = write_q.get()
+        if frame is None:
+            break
+        if errors:
+            continue  # keep draining so the producer's put() never blocks forever
+        try:
+            out.write(frame)
+        except Exception as e:
+            errors.append(e)
+
+def build_hand_sprites(width, height):
+    """Pre-render the hand representation for 0-5 fingers as (sprite, mask) tiles"""
+    
+    # Tile around the hand center that covers the palm and extended fingers
+    hand_x = width // 4
+    hand_y = height // 2
+    box = (hand_x - 60, hand_y - 120, hand_x + 60, hand_y + 60)
+    x0, y0, x1, y1 = box
+    
+    sprites = {}
+    for finger_count in range(6):
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        draw_hand_representation(canvas, finger_count, width, height)
+        sprite = canvas[y0:y1, x0:x1].copy()
+        # Every drawn color is non-zero, so the mask is just the painted pixels
+        mask = sprite.any(axis=2, keepdims=True)
+        sprites[finger_count] = (sprite, mask)
+    return box, sprites
+
 def draw_hand_representation(frame, finger_count, width, height):
     """Draw a simple hand representation showing the finger count"""
     
@@ -1,21 +1,55 @@
 # main.py
 import sys
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
+from PyQt5.QtCore import Qt, QCoreApplication
+from PyQt5.QtGui import QSurfaceFormat
 from PyQt5.QtWidgets import QApplication
 from app.ui import MediaControllerUI
 from app import initialize_logging, __appname__, __version__
-from app.config import LOGGING_LEVEL
+from app.config import LOGGING_LEVEL, LOG_BUFFER_CAPACITY, LOG_FLUSH_INTERVAL
 
 def configure_logging():
     """Configure logging with file and console output"""
-    # Set up file handler
+    # Set up file handler, buffered in memory and flushed on ERROR, when the
+    # buffer fills, every LOG_FLUSH_INTERVAL seconds and at exit
     file_handler = logging.FileHandler("app.log")
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler)
     # Set up console handler
     console_handler = logging.StreamHandler(sys.stdout)
     
-    # Add handlers to the root logger
-    logging.getLogger().addHandler(file_handler)
-    logging.getLogger().addHandler(console_handler)
+    # Replace basicConfig's synchronous stderr handler, keeping its format for
+    # the file and console output
+    root = logging.getLogger()
+    formatter = next((h.formatter for h in root.handlers if h.formatter), None)
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+    
+    # The root logger only enqueues records; a listener thread does the I/O so
+    # the GUI and gesture threads never block on the console or disk
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    
+    stop_flushing = threading.Event()
+    def flush_periodically():
+        while not stop_flushing.wait(LOG_FLUSH_INTERVAL):
+            buffered_file_handler.flush()
+    threading.Thread(target=flush_periodically, daemon=True).start()
+    
+    # atexit runs in reverse order: drain the queue first, then write out the buffer
+    atexit.register(buffered_file_handler.close)
+    atexit.register(stop_flushing.set)
+    atexit.register(listener.stop)
 
 def main():
     # Initialize logging with the level from config
@@ -25,6 +59,14 @@ def main():
     
     logging.info(f"Starting {__appname__} v{__version__}")
 
+    # Settle the OpenGL setup before QApplication exists: one shared context is
+    # created at start-up rather than lazily on the first shown frame, and
+    # GL surfaces present without waiting for vsync
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    surface_format = QSurfaceFormat()
+    surface_format.setSwapInterval(0)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+
     app = QApplication(sys.argv)
     window = MediaControllerUI()
     window.show()
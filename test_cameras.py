@@ -4,138 +4,249 @@ Camera Detection Script
 This script helps you identify which camera index to use for your external camera.
 """
 
+import argparse
 import cv2
+import glob
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.console_log import get_logger, flush_console
+from app.preview import grab_latest, preview_until
+
+log = get_logger(__name__)
+
+# Single-frame diagnostics gain nothing from OpenCV's worker pool; skip spinning it up
+cv2.setNumThreads(1)
+
+# Native capture backend per platform, so each probe skips OpenCV's backend fallback chain
+if sys.platform == "win32":
+    CAMERA_BACKEND = cv2.CAP_DSHOW
+elif sys.platform == "darwin":
+    CAMERA_BACKEND = cv2.CAP_AVFOUNDATION
+elif sys.platform.startswith("linux"):
+    CAMERA_BACKEND = cv2.CAP_V4L2
+else:
+    CAMERA_BACKEND = cv2.CAP_ANY
+
+# Upper bound on waiting for a camera's frame; OpenCV < 4.5.5 has no such property
+PROBE_TIMEOUT_MS = 3000
+HAVE_READ_TIMEOUT = hasattr(cv2, "CAP_PROP_READ_TIMEOUT_MSEC")
+
+def open_camera(index):
+    """Open a camera on the native backend with a bounded read timeout where supported"""
+    cap = cv2.VideoCapture(index, CAMERA_BACKEND)
+    # Local camera backends take no open-time parameters; set() is simply
+    # ignored by backends without a read timeout
+    if HAVE_READ_TIMEOUT and cap.isOpened():
+        cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, PROBE_TIMEOUT_MS)
+    return cap
+
+# Indices probed when the platform can't list its capture devices
+FALLBACK_INDICES = range(10)
+
+def enumerate_indices():
+    """Camera indices that actually exist, so probes skip slow failed opens"""
+    if sys.platform.startswith("linux"):
+        nodes = glob.glob("/dev/video*")
+        return sorted(int(m.group(1)) for m in (re.search(r"(\d+)$", n) for n in nodes) if m)
+    if sys.platform == "win32":
+        try:
+            from pygrabber.dshow_graph import FilterGraph
+        except ImportError:  # pygrabber is optional; probe the default range instead
+            return list(FALLBACK_INDICES)
+        # DirectShow device order matches the CAP_DSHOW index order
+        return list(range(len(FilterGraph().get_input_devices())))
+    return list(FALLBACK_INDICES)
+
+# All previews share one window, created once per session
+PREVIEW_WINDOW = 'Camera Preview'
+PREVIEW_TILE_HEIGHT = 240
+
+def tile_previews(frames):
+    """Scale frames to a common height and place them side by side"""
+    tiles = [cv2.resize(f, (max(1, f.shape[1] * PREVIEW_TILE_HEIGHT // f.shape[0]), PREVIEW_TILE_HEIGHT))
+             for f in frames]
+    return cv2.hconcat(tiles)
+
+def probe_camera(index):
+    """Open one camera index and read a frame; returns (index, status, info, frame)"""
+    cap = open_camera(index)
+    try:
+        if not cap.isOpened():
+            return index, "closed", None, None
+        ret, frame = cap.read()
+        if not ret:
+            return index, "no_frames", None, None
+        info = {
+            'index': index,
+            'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': cap.get(cv2.CAP_PROP_FPS)
+        }
+        return index, "working", info, frame
+    finally:
+        cap.release()
 
 def test_cameras():
     """Test and display information about available cameras"""
-    print("🎥 Camera Detection Script")
-    print("=" * 40)
+    log.info("🎥 Camera Detection Script")
+    log.info("=" * 40)
     
     available_cameras = []
+    previews = {}
     
-    for i in range(10):  # Test first 10 camera indices
-        print(f"Testing camera index {i}...", end=" ")
-        
-        cap = cv2.VideoCapture(i)
-        
-        if cap.isOpened():
-            ret, frame = cap.read()
-            if ret:
-                # Get camera properties
-                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                fps = cap.get(cv2.CAP_PROP_FPS)
-                
-                available_cameras.append({
-                    'index': i,
-                    'width': width,
-                    'height': height,
-                    'fps': fps
-                })
-                
-                print(f"✅ WORKING - Resolution: {width}x{height}, FPS: {fps:.1f}")
-                
-                # Show a preview window for 2 seconds
-                cv2.imshow(f'Camera {i} Preview', frame)
-                cv2.waitKey(2000)  # Show for 2 seconds
-                cv2.destroyAllWindows()
-                
-            else:
-                print("❌ Can't read frames")
-            
-            cap.release()
+    indices = enumerate_indices()
+    
+    # Device opens are I/O bound, so probe every index concurrently
+    results = []
+    if indices:
+        with ThreadPoolExecutor(max_workers=len(indices)) as executor:
+            results = list(executor.map(probe_camera, indices))
+    
+    for i, status, info, frame in results:
+        if status == "working":
+            available_cameras.append(info)
+            previews[i] = frame
+            result = f"✅ WORKING - Resolution: {info['width']}x{info['height']}, FPS: {info['fps']:.1f}"
+        elif status == "no_frames":
+            result = "❌ Can't read frames"
         else:
-            print("❌ Can't open")
+            result = "❌ Can't open"
+        log.info(f"Testing camera index {i}... {result}")
+    
+    # HighGUI is not thread-safe, so previews run afterwards on this thread;
+    # all cameras are shown side by side in one window for 2 seconds
+    if previews:
+        cv2.namedWindow(PREVIEW_WINDOW, cv2.WINDOW_AUTOSIZE)
+        cv2.setWindowTitle(PREVIEW_WINDOW, "Cameras " + ", ".join(map(str, previews)))
+        preview_until(time.perf_counter() + 2.0, {PREVIEW_WINDOW: tile_previews(previews.values())})
+        cv2.destroyAllWindows()
     
-    print("\n" + "=" * 40)
-    print("📋 SUMMARY:")
+    log.info("\n" + "=" * 40)
+    log.info("📋 SUMMARY:")
     
     if available_cameras:
-        print(f"Found {len(available_cameras)} working camera(s):")
+        log.info(f"Found {len(available_cameras)} working camera(s):")
         for cam in available_cameras:
-            print(f"  • Camera {cam['index']}: {cam['width']}x{cam['height']} @ {cam['fps']:.1f}fps")
+            log.info(f"  • Camera {cam['index']}: {cam['width']}x{cam['height']} @ {cam['fps']:.1f}fps")
         
-        print(f"\n💡 RECOMMENDATION:")
+        log.info(f"\n💡 RECOMMENDATION:")
         if len(available_cameras) > 1:
-            print(f"   - Camera 0 is usually the built-in camera")
-            print(f"   - Camera {available_cameras[1]['index']} is likely your external camera")
-            print(f"   - Set CAMERA_INDEX = {available_cameras[1]['index']} in app/config.py")
+            log.info(f"   - Camera 0 is usually the built-in camera")
+            log.info(f"   - Camera {available_cameras[1]['index']} is likely your external camera")
+            log.info(f"   - Set CAMERA_INDEX = {available_cameras[1]['index']} in app/config.py")
         else:
-            print(f"   - Only one camera found at index {available_cameras[0]['index']}")
-            print(f"   - Set CAMERA_INDEX = {available_cameras[0]['index']} in app/config.py")
+            log.info(f"   - Only one camera found at index {available_cameras[0]['index']}")
+            log.info(f"   - Set CAMERA_INDEX = {available_cameras[0]['index']} in app/config.py")
     else:
-        print("❌ No working cameras found!")
-        print("   - Make sure your camera is connected")
-        print("   - Try different USB ports")
-        print("   - Check if camera is being used by another application")
+        log.warning("❌ No working cameras found!")
+        log.info("   - Make sure your camera is connected")
+        log.info("   - Try different USB ports")
+        log.info("   - Check if camera is being used by another application")
 
 def interactive_camera_test():
     """Interactive camera testing with live preview"""
-    print("\n🔴 INTERACTIVE MODE")
-    print("Press 'q' to quit, 'n' for next camera")
+    log.info("\n🔴 INTERACTIVE MODE")
+    log.info("Press 'q' to quit, 'n' for next camera")
     
-    camera_index = 0
-    while camera_index < 10:
-        print(f"\nTesting camera {camera_index}...")
-        cap = cv2.VideoCapture(camera_index)
-        
-        if cap.isOpened():
-            print(f"Camera {camera_index} opened successfully!")
-            print("Press 'q' to quit, 'n' for next camera, any other key to continue")
+    indices = enumerate_indices()
+    cv2.namedWindow(PREVIEW_WINDOW, cv2.WINDOW_AUTOSIZE)
+    try:
+        for camera_index in indices:
+            log.info(f"\nTesting camera {camera_index}...")
+            cap = open_camera(camera_index)
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    print("Failed to read frame")
-                    break
-                
-                # Add text overlay
-                cv2.putText(frame, f'Camera {camera_index} - Press q to quit, n for next', 
-                           (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                
-                cv2.imshow(f'Camera {camera_index} Test', frame)
-                
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    cap.release()
-                    cv2.destroyAllWindows()
-                    return
-                elif key == ord('n'):
-                    break
+            if not cap.isOpened():
+                log.info(f"Camera {camera_index} not available")
+                continue
             
-            cap.release()
-            cv2.destroyAllWindows()
-        else:
-            print(f"Camera {camera_index} not available")
-        
-        camera_index += 1
+            log.info(f"Camera {camera_index} opened successfully!")
+            log.info("Press 'q' to quit, 'n' for next camera, any other key to continue")
+            # Reuse the window for every camera; only its title changes
+            cv2.setWindowTitle(PREVIEW_WINDOW, f'Camera {camera_index} Test')
+            
+            try:
+                while True:
+                    ret, frame = grab_latest(cap)
+                    if not ret:
+                        log.info("Failed to read frame")
+                        break
+                    
+                    # Add text overlay
+                    cv2.putText(frame, f'Camera {camera_index} - Press q to quit, n for next', 
+                               (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                    
+                    cv2.imshow(PREVIEW_WINDOW, frame)
+                    
+                    key = cv2.waitKey(1) & 0xFF
+                    if key == ord('q'):
+                        return
+                    elif key == ord('n'):
+                        break
+            finally:
+                cap.release()
+    finally:
+        cv2.destroyAllWindows()
     
-    print("Tested all cameras (0-9)")
+    log.info(f"Tested all cameras ({', '.join(map(str, indices)) or 'none found'})")
 
-if __name__ == "__main__":
-    print("Choose testing mode:")
-    print("1. Quick test (automatic)")
-    print("2. Interactive test (manual)")
-    print("3. Test RTSP camera (run test_rtsp_camera.py)")
+def run_rtsp_test(rtsp_url, transport, substream_url=None):
+    """Quick RTSP connection test via test_rtsp_camera.py"""
+    if not rtsp_url:
+        log.info("For RTSP camera testing, please run:")
+        log.info("python test_rtsp_camera.py")
+        return
+    from test_rtsp_camera import test_rtsp_connection
+    test_rtsp_connection(rtsp_url, transport, substream_url)
+
+# Menu numbers of the interactive prompt, mapped to --mode values
+MODES = ["quick", "interactive", "rtsp"]
+MENU_CHOICES = {str(n): mode for n, mode in enumerate(MODES, 1)}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Find the camera index to use for your external camera")
+    parser.add_argument("--mode", choices=MODES, help="test to run (prompts when omitted on a terminal)")
+    parser.add_argument("--rtsp-url", help="RTSP URL for --mode rtsp")
+    parser.add_argument("--transport", default="tcp", choices=["tcp", "udp"], help="RTSP transport")
+    parser.add_argument("--substream-url",
+                        help="camera's low-resolution stream URL to probe instead (--mode rtsp)")
+    return parser.parse_args()
+
+def prompt_mode():
+    log.info("Choose testing mode:")
+    log.info("1. Quick test (automatic)")
+    log.info("2. Interactive test (manual)")
+    log.info("3. Test RTSP camera (run test_rtsp_camera.py)")
+    flush_console()
+    choice = input("Enter choice (1-3): ").strip()
+    if choice not in MENU_CHOICES:
+        log.info("Invalid choice. Running quick test...")
+    return MENU_CHOICES.get(choice, "quick")
+
+def main():
+    args = parse_args()
+    dispatch = {
+        "quick": test_cameras,
+        "interactive": interactive_camera_test,
+        "rtsp": lambda: run_rtsp_test(args.rtsp_url, args.transport, args.substream_url),
+    }
     
     try:
-        choice = input("Enter choice (1-3): ").strip()
-        
-        if choice == "1":
-            test_cameras()
-        elif choice == "2":
-            interactive_camera_test()
-        elif choice == "3":
-            print("For RTSP camera testing, please run:")
-            print("python test_rtsp_camera.py")
-        else:
-            print("Invalid choice. Running quick test...")
-            test_cameras()
+        mode = args.mode
+        if mode is None:
+            # Only prompt when someone is there to answer
+            mode = prompt_mode() if sys.stdin.isatty() else "quick"
+        dispatch[mode]()
             
     except KeyboardInterrupt:
-        print("\n\nTest interrupted by user")
+        log.info("\n\nTest interrupted by user")
     except Exception as e:
-        print(f"\nError: {e}")
+        log.error(f"\nError: {e}")
     
-    print("\n✅ Camera testing complete!")
\ No newline at end of file
+    log.info("\n✅ Camera testing complete!")
+
+if __name__ == "__main__":
+    main()